@@ -42,10 +42,7 @@ class AOC2023Day17(AOC, TupleMixin):
         '''
         Load the input data into a Grid object
         '''
-        self.crucible: Grid = Grid(
-            self.input,
-            lambda col: int(col),  # pylint: disable=unnecessary-lambda
-        )
+        self.crucible: Grid = Grid(self.input, int)
 
     def solve(
         self,
@@ -22,7 +22,7 @@ class HikingMap(Grid):
         '''
         Load the file from the Path object
         '''
-        super().__init__(data, row_cb=lambda col: int(col))  # pylint: disable=unnecessary-lambda
+        super().__init__(data, row_cb=int)
 
     @property
     def trailheads(self) -> Iterator[XY]:
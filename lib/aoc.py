@@ -1,20 +1,24 @@
 '''
 Base class for Advent of Code submissions
 '''
+# pylint: disable=too-many-lines
 from __future__ import annotations
 import copy
 import functools
 import hashlib
+import itertools
 import math
+import mmap
 import operator
+import os
 import re
 import sys
 import time
-from collections import namedtuple, Counter
-from collections.abc import Callable, Iterator, Sequence
+from collections import namedtuple, deque, Counter
+from collections.abc import Callable, Iterable, Iterator, Sequence
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple
 
 # Type hints
 Row = float
@@ -90,10 +94,34 @@ oper_map: dict[str, Callable[[Any, Any], Any]] = {
 }
 
 
-@dataclass(frozen=True)
-class Coordinate:
+def make_binop(op: str) -> Callable[[Any, Any], Any]:
+    '''
+    Return the function from oper_map for the specified operator. When the
+    same operator is applied repeatedly (e.g. in a loop), bind the result of
+    this function to a local variable outside of the loop, so that the dict
+    lookup only happens once:
+
+        add = make_binop('+')
+        for x, y in pairs:
+            total += add(x, y)
+    '''
+    return oper_map[op]
+
+
+def partial_binop(op: str, rhs: Any) -> Callable[[Any], Any]:
+    '''
+    Return a function which applies the specified operator with a fixed
+    right-hand operand. For example, partial_binop('*', 3)(x) is equivalent to
+    x * 3. Both the operator and operand are resolved once, up front.
     '''
-    Dataclass representing a single 2D coordinate
+    func: Callable[[Any, Any], Any] = oper_map[op]
+    return lambda lhs: func(lhs, rhs)
+
+
+class Coordinate(NamedTuple):
+    '''
+    Immutable type representing a single 2D coordinate. As a NamedTuple, this
+    hashes and compares in C, which matters when used as dict/set keys.
     '''
     x: float
     y: float
@@ -101,23 +129,39 @@ class Coordinate:
     @property
     def as_tuple(self) -> tuple[float, float]:
         '''
-        Return the contents of this dataclass as tuple
+        Return the contents of this coordinate as tuple. Since a Coordinate is
+        already a tuple, this is just the object itself.
         '''
-        return self.x, self.y
+        return self
 
     @property
-    def neighbors(self) -> Iterator[Coordinate]:
+    def neighbors(self) -> tuple[Coordinate, Coordinate, Coordinate, Coordinate]:
+        '''
+        Return the neighboring Coordinates, in the same order as the
+        directions namedtuple. A tuple is returned rather than using a
+        generator, to avoid setting one up for every node expansion.
+        '''
+        x: float = self.x
+        y: float = self.y
+        return (
+            Coordinate(x - 1, y),
+            Coordinate(x, y + 1),
+            Coordinate(x + 1, y),
+            Coordinate(x, y - 1),
+        )
+
+    def __add__(self, other: Coordinate) -> Coordinate:
         '''
-        Return the neighboring Coordinates
+        Add the X and Y params of both objects, returning a new object. This
+        overrides tuple concatenation, so that + behaves the same as it does
+        for Coordinate3D.
         '''
-        for direction in directions:
-            yield Coordinate(self.x + direction[0], self.y + direction[1])
+        return Coordinate(self.x + other.x, self.y + other.y)
 
 
-@dataclass(frozen=True)
-class Coordinate3D:
+class Coordinate3D(NamedTuple):
     '''
-    Dataclass representing a single 3D coordinate
+    Immutable type representing a single 3D coordinate
     '''
     x: float
     y: float
@@ -126,9 +170,10 @@ class Coordinate3D:
     @property
     def as_tuple(self) -> tuple[float, float, float]:
         '''
-        Return the contents of this dataclass as tuple
+        Return the contents of this coordinate as tuple. Since a Coordinate3D
+        is already a tuple, this is just the object itself.
         '''
-        return self.x, self.y, self.z
+        return self
 
     def distance_from(self, other: Coordinate3D) -> int:
         '''
@@ -168,10 +213,10 @@ class LineSegment:
             (18, 19) -> (17, 18)    a.k.a. (x₃, y₃) -> (x₄, y₄)
 
         '''
-        x1, y1 = self.first.as_tuple
-        x2, y2 = self.second.as_tuple
-        x3, y3 = other.first.as_tuple
-        x4, y4 = other.second.as_tuple
+        x1, y1 = self.first
+        x2, y2 = self.second
+        x3, y3 = other.first
+        x4, y4 = other.second
 
         divisor = ((x1-x2) * (y3-y4)) - ((y1-y2) * (x3-x4))
         if not divisor:
@@ -195,7 +240,163 @@ class LineSegment:
         '''
         return self & other
 
+    @classmethod
+    def intersect_all(
+        cls,
+        segs_a: Iterable[LineSegment],
+        segs_b: Iterable[LineSegment],
+    ) -> list[list[Coordinate | None]]:
+        '''
+        Return the intersections between every segment in segs_a and every
+        segment in segs_b, as a matrix in which ret[i][j] is the same as
+        segs_a[i] & segs_b[j].
+
+        The terms of the formula which only depend on one of the two segments
+        (see __and__) are computed once per segment up front, rather than
+        once per pair, leaving only the cross terms in the inner loop.
+        '''
+        def terms(segs: Iterable[LineSegment]) -> list[tuple[float, float, float]]:
+            '''
+            Return (x₁ - x₂), (y₁ - y₂), and (x₁y₂ - y₁x₂) for each segment
+            '''
+            ret: list[tuple[float, float, float]] = []
+            seg: LineSegment
+            for seg in segs:
+                x1, y1 = seg.first
+                x2, y2 = seg.second
+                ret.append((x1 - x2, y1 - y2, (x1 * y2) - (y1 * x2)))
+            return ret
+
+        terms_b: list[tuple[float, float, float]] = terms(segs_b)
+        ret: list[list[Coordinate | None]] = []
+
+        for dx_a, dy_a, det_a in terms(segs_a):
+            row: list[Coordinate | None] = []
+            for dx_b, dy_b, det_b in terms_b:
+                divisor: float = (dx_a * dy_b) - (dy_a * dx_b)
+                row.append(
+                    Coordinate(
+                        ((det_a * dx_b) - (dx_a * det_b)) / divisor,
+                        ((det_a * dy_b) - (dy_a * det_b)) / divisor,
+                    ) if divisor else None
+                )
+            ret.append(row)
+
+        return ret
+
+    def intersect_stable(self, other: LineSegment) -> Coordinate | None:
+        '''
+        Alternative to the & operator which avoids the large products in the
+        determinant formula. Those products lose precision when the segments
+        are long (or nearly parallel), since they are subtracted from one
+        another to get a comparatively small result.
+
+        Instead, each line is expressed in slope-intercept form, anchored on
+        its first point:
+
+            f₁₂(x) = y₁ + a₁₂(x - x₁)
+            f₃₄(x) = y₃ + a₃₄(x - x₃)
+
+        Starting from a guess of x̂ = x₂, the gap between the two lines at x̂
+        is closed by moving along x by the difference in heights divided by
+        the difference in slopes:
+
+            x̂ = x̂ + (f₁₂(x̂) - f₃₄(x̂)) / (a₃₄ - a₁₂)
+
+        For exact arithmetic a single step lands on the intersection. Running
+        a second step refines away the rounding error from the first.
+        '''
+        x1, y1 = self.first
+        x2, y2 = self.second
+        x3, y3 = other.first
+        x4, y4 = other.second
+
+        if x1 == x2 and x3 == x4:
+            # Both lines are vertical, so they are parallel
+            return None
+
+        # A vertical line has an infinite slope, but the intersection is then
+        # simply the other line's height at that line's x value.
+        if x1 == x2:
+            return Coordinate(x1, y3 + (y4 - y3) / (x4 - x3) * (x1 - x3))
+        if x3 == x4:
+            return Coordinate(x3, y1 + (y2 - y1) / (x2 - x1) * (x3 - x1))
+
+        a12: float = (y2 - y1) / (x2 - x1)
+        a34: float = (y4 - y3) / (x4 - x3)
+        if a12 == a34:
+            # No intersection
+            return None
+
+        f12: Callable[[float], float] = lambda x: y1 + a12 * (x - x1)
+        f34: Callable[[float], float] = lambda x: y3 + a34 * (x - x3)
+
+        x_c: float = x2
+        for _ in range(2):
+            x_c += (f12(x_c) - f34(x_c)) / (a34 - a12)
+
+        return Coordinate(x_c, min(f12(x_c), f34(x_c)))
+
+
+def _intersect3d(  # pylint: disable=too-many-positional-arguments
+    ax: float,
+    ay: float,
+    az: float,
+    bx: float,
+    by: float,
+    bz: float,
+    cx: float,
+    cy: float,
+    cz: float,
+    dx: float,
+    dy: float,
+    dz: float,
+) -> tuple[bool, float, float, float]:
+    '''
+    The math behind LineSegment3D.__and__ (see that method for an explanation
+    of how it works), for lines (a, b) and (c, d). Takes and returns only
+    scalars, so that it is a self-contained kernel which avoids building any
+    objects, and could be swapped out for a compiled version if desired.
 
+    Returns a tuple containing a boolean (True if the lines intersect), and
+    the x, y, and z values of the point of intersection.
+    '''
+    # Gather the integer constants from the first and second equations on
+    # the "right" side.
+    const0 = cx - ax
+    const1 = cy - ay
+    const2 = cz - az
+    # Gather the multipliers for alpha and beta on the "left" side.
+    alpha_multiplier0 = bx
+    beta_multiplier0 = -dx
+    alpha_multiplier1 = by
+    beta_multiplier1 = -dy
+    alpha_multiplier2 = bz
+    beta_multiplier2 = -dz
+    # Divide all multipliers and constants by the alpha-multiplier for the
+    # first equation.
+    beta_multiplier0 /= alpha_multiplier0
+    const0 /= alpha_multiplier0
+    alpha_multiplier0 /= alpha_multiplier0
+    # Repeat for the second equation, but then reverse the sign. This will
+    # produce a first equation that is alpha + something, and a second
+    # equation that is -alpha - something.
+    beta_multiplier1 = -(beta_multiplier1 / alpha_multiplier1)
+    const1 = -(const1 / alpha_multiplier1)
+    alpha_multiplier1 = -(alpha_multiplier1 / alpha_multiplier1)
+    # Now that we have performed the above, we can add the two equations
+    # together and divide by the sum of the beta multipliers. The alpha
+    # multipliers will cancel out.
+    beta = (const0 + const1) / (beta_multiplier0 + beta_multiplier1)
+    # Alpha can now be calculated by substituting beta in either of the
+    # first two equations and then dividing by its alpha mulitplier.
+    alpha = (const0 - (beta_multiplier0 * beta)) / alpha_multiplier0
+
+    if (alpha_multiplier2 * alpha) + (beta_multiplier2 * beta) != const2:
+        # No intersection
+        return False, 0.0, 0.0, 0.0
+
+    return True, ax + (alpha * bx), ay + (alpha * by), az + (alpha * bz)
 
 
 @dataclass(frozen=True)
@@ -287,48 +488,13 @@ class LineSegment3D:
             or (4, 4, 2)
 
         '''
-        # Gather the integer constants from the first and second equations on
-        # the "right" side.
-        const0 = other.first.x - self.first.x
-        const1 = other.first.y - self.first.y
-        const2 = other.first.z - self.first.z
-        # Gather the multipliers for alpha and beta on the "left" side.
-        alpha_multiplier0 = self.second.x
-        beta_multiplier0 = -other.second.x
-        alpha_multiplier1 = self.second.y
-        beta_multiplier1 = -other.second.y
-        alpha_multiplier2 = self.second.z
-        beta_multiplier2 = -other.second.z
-        # Divide all multipliers and constants by the alpha-multiplier for the
-        # first equation.
-        alpha_multiplier0, beta_multiplier0, const0 = map(
-            lambda a: a / alpha_multiplier0,
-            (alpha_multiplier0, beta_multiplier0, const0)
-        )
-        # Repeat for the second equation, but then reverse the sign. This will
-        # produce a first equation that is alpha + something, and a second
-        # equation that is -alpha - something.
-        alpha_multiplier1, beta_multiplier1, const1 = map(
-            lambda a: -(a / alpha_multiplier1),
-            (alpha_multiplier1, beta_multiplier1, const1)
-        )
-        # Now that we have performed the above, we can add the two equations
-        # together and divide by the sum of the beta multipliers. The alpha
-        # multipliers will cancel out.
-        beta = (const0 + const1) / (beta_multiplier0 + beta_multiplier1)
-        # Alpha can now be calculated by substituting beta in either of the
-        # first two equations and then dividing by its alpha mulitplier.
-        alpha = (const0 - (beta_multiplier0 * beta)) / alpha_multiplier0
-
-        if (alpha_multiplier2 * alpha) + (beta_multiplier2 * beta) != const2:
-            # No intersection
-            return None
-
-        return Coordinate3D(
-            self.first.x + (alpha * self.second.x),
-            self.first.y + (alpha * self.second.y),
-            self.first.z + (alpha * self.second.z),
+        hit, x, y, z = _intersect3d(
+            *self.first,
+            *self.second,
+            *other.first,
+            *other.second,
         )
+        return Coordinate3D(x, y, z) if hit else None
 
     def intersection(self, other: LineSegment3D) -> Coordinate3D | None:
         '''
@@ -347,21 +513,21 @@ class TupleMixin:
         '''
         Add each element of both tuples, returning a new tuple
         '''
-        return tuple(map(lambda a, b: a + b, t1, t2))
+        return tuple(map(operator.add, t1, t2))
 
     @staticmethod
     def tuple_subtract(t1: tuple[int, ...], t2: tuple[int, ...]) -> tuple[int, ...]:
         '''
-        Add each element of both tuples, returning a new tuple
+        Subtract each element of t2 from t1, returning a new tuple
         '''
-        return tuple(map(lambda a, b: a - b, t1, t2))
+        return tuple(map(operator.sub, t1, t2))
 
     @staticmethod
     def tuple_multiply_all(data: tuple[int, ...], factor: int) -> tuple[int, ...]:
         '''
         Multiply all items in the tuple by the given factor
         '''
-        return tuple(map(lambda i: i * factor, data))
+        return tuple(map(operator.mul, data, itertools.repeat(factor)))
 
 
 class XYMixin:
@@ -376,15 +542,32 @@ class XYMixin:
         '''
         return abs(p1[0] - p2[0]) + abs(p1[1] - p2[1])
 
+    @staticmethod
+    def distances_to(points: Iterable[XY], query: XY) -> list[int]:
+        '''
+        Calculate the Manhattan Distance between each of the points and the
+        query coordinate. This gives the same results as calling distance()
+        for each point, but in a single list comprehension rather than making
+        one function call per point.
+        '''
+        query_row, query_col = query
+        return [
+            abs(row - query_row) + abs(col - query_col)
+            for row, col in points
+        ]
+
     def perimeter(self, bounds: list[XY]) -> int:
         '''
         Calculate the lenth of the perimeter of a polygon, given a list of
         coordinates in either clockwise or counter-clockwise order.
         '''
+        # Pair each vertex with the next one (wrapping around to the first)
+        # and compute the Manhattan distance inline, rather than making a
+        # method call to distance() for every edge.
         return sum(
-            self.distance(bounds[n], bounds[n + 1])
-            for n in range(len(bounds) - 1)
-        ) + self.distance(bounds[-1], bounds[0])
+            abs(row1 - row2) + abs(col1 - col2)
+            for (row1, col1), (row2, col2) in zip(bounds, bounds[1:] + bounds[:1])
+        )
 
     @staticmethod
     def shoelace(bounds: list[XY]) -> float:
@@ -401,17 +584,23 @@ class XYMixin:
             A = 1/2 * Σ|row(x)*col(x+1) - row(x+1)*col(x)|
 
         This sum includes the final vertex being compared to the first one.
-        To accomplish this in a pretty generator expression, this function
-        instead starts by comparing list index -1 with 0, and finishes
-        comparing the 2nd-to-last index with the first one. By doing so, it
-        manages to compare all vertexes.
-        '''
-        return abs(
-            sum(
-                (bounds[n][0] * bounds[n - 1][1]) - (bounds[n - 1][0] * bounds[n][1])
-                for n in range(len(bounds))
-            ) / 2
-        )
+        To accomplish this, the loop starts with the last vertex as the
+        "previous" one, so that the first pass compares the last vertex with
+        the first, and each later pass compares a vertex with the one before
+        it. Carrying the previous vertex along in local variables avoids
+        indexing into the list twice per vertex, or building any copies of it.
+        '''
+        if not bounds:
+            return 0
+
+        prev_row, prev_col = bounds[-1]
+        total: float = 0
+        row: Row
+        col: Column
+        for row, col in bounds:
+            total += (prev_row * col) - (row * prev_col)
+            prev_row, prev_col = row, col
+        return abs(total) / 2
 
 class MathMixin:
     '''
@@ -529,6 +718,10 @@ class MathMixin:
         return (Dx / D), (Dy / D)
 
 
+# Translation table which converts ASCII digits to their integer values
+_DIGITS: bytes = bytes.maketrans(b'0123456789', bytes(range(10)))
+
+
 class Grid(TupleMixin, XYMixin):
     '''
     Manage a grid as a list of list of strings. Can be indexed like a 2D array.
@@ -550,25 +743,21 @@ class Grid(TupleMixin, XYMixin):
         '''
         self.data = []
         try:
-            fh = data.open()
+            # Read the whole file at once and decode it in a single pass,
+            # rather than iterating over the lines of a text-mode file handle.
+            buf: bytes = data.read_bytes()
         except AttributeError:
             if isinstance(data, str):
                 # If input was a string, split it into a list of strings
-                self.data = [
-                    [row_cb(col) for col in line.rstrip()]
-                    for line in data.splitlines()
-                ]
+                self.data = self._load_lines(data.splitlines(), row_cb)
             else:
                 # Assume grid data is a pre-assembled list of lists
                 self.data = data
         else:
-            self.data = [
-                [row_cb(col) for col in line.rstrip()]
-                for line in fh
-            ]
-            fh.close()
+            self.data = self._load_lines(buf.decode().splitlines(), row_cb)
         self.rows = len(self.data)
-        self.cols = max(len(row) for row in self.data)
+        self.cols = max((len(row) for row in self.data), default=0)
+        self.data = self._pad_rows(self.data, self.cols)
         self.max_row = self.rows - 1
         self.max_col = self.cols - 1
 
@@ -577,7 +766,74 @@ class Grid(TupleMixin, XYMixin):
             tuple(-1 * x for x in nesw)
             for nesw in self.directions
         )
-        self.initial_state = copy.deepcopy(self.data)
+        self.initial_state = self._copy_data(self.data)
+
+    @staticmethod
+    def from_mmap_shared(
+        path: Path | str,
+        neighbor_order: Directions = directions,
+    ) -> SharedByteGrid:
+        '''
+        Load a grid by memory-mapping the file read-only, rather than reading
+        it into memory. See SharedByteGrid for details.
+        '''
+        return SharedByteGrid(path, neighbor_order)
+
+    @staticmethod
+    def _copy_data(data: list[Any]) -> list[Any]:
+        '''
+        Return a copy of the grid data, to save and restore the initial state
+        '''
+        return copy.deepcopy(data)
+
+    @staticmethod
+    def _load_lines(
+        lines: Iterable[str],
+        row_cb: Callable[[str], Any],
+    ) -> list[list[Any]]:
+        '''
+        Run the callback on each column of each line. Rows are not padded here
+        (see _pad_rows()), so the callback never sees the padding.
+
+        If the callback is int and the lines are all digits and all the same
+        length, each row is instead stored as a bytearray of the digits'
+        values. Indexing a bytearray still returns an int, but each cell takes
+        up a single byte rather than being a separate int object, and the whole
+        row is converted by one bytes.translate() call instead of an int() per
+        cell.
+        '''
+        lines = [line.rstrip() for line in lines]
+        if row_cb is int and len({len(line) for line in lines}) == 1 and all(
+            line.isascii() and line.isdigit() for line in lines
+        ):
+            return [bytearray(line.encode().translate(_DIGITS)) for line in lines]
+
+        return [[row_cb(col) for col in line] for line in lines]
+
+    @staticmethod
+    def _pad_rows(data: list[Any], width: int) -> list[Any]:
+        '''
+        Return a new list of rows, in which any rows of characters which are
+        shorter than the specified width are replaced by copies padded with
+        spaces (see the note about trailing whitespace in __getitem__), so
+        that they can be indexed directly. The rows passed in are never
+        modified, as they may belong to the caller (i.e. pre-assembled data).
+
+        Rows containing anything other than strings (e.g. the ints from a
+        row_cb of int) are left as-is, since a space would not be a valid value
+        for them. Reading past the end of such a row through __getitem__() or
+        neighbors() returns a space, just like any other short row.
+        '''
+        padded: list[Any] = []
+        row: Sequence[Any]
+        for row in data:
+            if len(row) < width:
+                if isinstance(row, str):
+                    row = row.ljust(width)
+                elif all(isinstance(col, str) for col in row):
+                    row = [*row, *' ' * (width - len(row))]
+            padded.append(row)
+        return padded
 
     def __contains__(self, coord: XY) -> bool:
         '''
@@ -589,24 +845,30 @@ class Grid(TupleMixin, XYMixin):
         '''
         If index is an integer, return that index's row.
 
-        If index is a tuple, return the value at that row/column.
+        Otherwise, treat the index as a coordinate (e.g. a tuple or list), and
+        return the value at that row/column.
         '''
         if isinstance(index, int):
             return self.data[index]
 
-        if index not in self:
+        # Bounds-check inline rather than calling __contains__
+        if not (
+            0 <= index[0] <= self.max_row
+            and 0 <= index[1] <= self.max_col
+        ):
             raise IndexError(f'Coordinate {index!r} is outside of grid')
 
-        try:
-            return self.data[index[0]][index[1]]
-        except IndexError:
-            # My vim configuration deletes trailing whitespace on buffer write.
-            # So, it is possible to have a valid coordinate that is within the
-            # bounds of the grid, but the column position is past the end of
-            # the row, because that line of the puzzle input ended in
-            # whitespace. Return a space to simulate an empty space at this
-            # position.
-            return ' '
+        row: list[Any] = self.data[index[0]]
+        if index[1] < len(row):
+            return row[index[1]]
+        # My vim configuration deletes trailing whitespace on buffer write.
+        # So, it is possible to have a valid coordinate that is within the
+        # bounds of the grid, but the column position is past the end of the
+        # row, because that line of the puzzle input ended in whitespace. Rows
+        # are padded out to the full width when the grid is loaded, but a row
+        # which is replaced afterward may not be. Return a space to simulate an
+        # empty space at this position.
+        return ' '
 
     def __setitem__(self, coord: XY, val: str) -> None:
         '''
@@ -621,7 +883,7 @@ class Grid(TupleMixin, XYMixin):
         '''
         Reset to the initial state
         '''
-        self.data = copy.deepcopy(self.initial_state)
+        self.data = self._copy_data(self.initial_state)
 
     def row(self, index: int) -> Any:
         '''
@@ -634,11 +896,160 @@ class Grid(TupleMixin, XYMixin):
         Generator which yields a tuple of each neigbboring coordinate and the
         value stored at that coordinate.
         '''
-        delta: XY
-        for delta in self.directions:
-            neighbor: XY = self.tuple_add(coord, delta)
-            if neighbor in self:
-                yield neighbor, self[neighbor]
+        data: list[list[Any]] = self.data
+        max_row: int = self.max_row
+        max_col: int = self.max_col
+        row, col = coord
+        value: Any
+
+        # A coordinate past the end of a short row yields a space, the same as
+        # __getitem__() does for it. Catching the IndexError costs nothing
+        # unless it is actually raised, unlike checking each row's length.
+        if self.directions is directions:
+            # For the default neighbor order (north, east, south, west), skip
+            # the loop over the deltas and handle each direction explicitly.
+            if 0 <= row - 1 <= max_row and 0 <= col <= max_col:
+                try:
+                    value = data[row - 1][col]
+                except IndexError:
+                    value = ' '
+                yield (row - 1, col), value
+            if 0 <= row <= max_row and 0 <= col + 1 <= max_col:
+                try:
+                    value = data[row][col + 1]
+                except IndexError:
+                    value = ' '
+                yield (row, col + 1), value
+            if 0 <= row + 1 <= max_row and 0 <= col <= max_col:
+                try:
+                    value = data[row + 1][col]
+                except IndexError:
+                    value = ' '
+                yield (row + 1, col), value
+            if 0 <= row <= max_row and 0 <= col - 1 <= max_col:
+                try:
+                    value = data[row][col - 1]
+                except IndexError:
+                    value = ' '
+                yield (row, col - 1), value
+            return
+
+        for row_delta, col_delta in self.directions:
+            new_row: int = row + row_delta
+            new_col: int = col + col_delta
+            if 0 <= new_row <= max_row and 0 <= new_col <= max_col:
+                try:
+                    value = data[new_row][new_col]
+                except IndexError:
+                    value = ' '
+                yield (new_row, new_col), value
+
+    def neighbors_bulk(self, coords: Iterable[XY]) -> list[tuple[XY, Any]]:
+        '''
+        Return the neighbors of many coordinates at once, as a list of tuples
+        of each neighboring coordinate and the value stored at that coordinate.
+
+        The result is the same as chaining together neighbors() for each of
+        the coordinates, but the whole batch is computed in a single list
+        comprehension rather than spinning up a generator per coordinate. This
+        is useful for expanding an entire BFS frontier in one call.
+        '''
+        data: list[list[Any]] = self.data
+        max_row: int = self.max_row
+        max_col: int = self.max_col
+        deltas: Directions = self.directions
+        return [
+            (
+                (new_row, new_col),
+                line[new_col] if new_col < len(line := data[new_row]) else ' ',
+            )
+            for row, col in coords
+            for row_delta, col_delta in deltas
+            if 0 <= (new_row := row + row_delta) <= max_row
+            and 0 <= (new_col := col + col_delta) <= max_col
+        ]
+
+    def passable(self, value: Any) -> bool:
+        '''
+        Return True if a tile containing the given value can be moved onto
+        during bfs(). Subclasses can override this to change what is a wall.
+        '''
+        return value != '#'
+
+    def bfs(
+        self,
+        start: XY,
+        goal: XY | None = None,
+        max_steps: int | None = None,
+    ) -> dict[XY, int] | int | None:
+        '''
+        Use breadth-first search to find the distance from the start coordinate
+        to every tile reachable from it, moving only onto tiles for which
+        passable() returns True. If max_steps is given, the search does not go
+        any further than that many steps from the start.
+
+        If a goal is given, return the distance to the goal (or None if it
+        cannot be reached). Otherwise, return a dict mapping each reachable
+        coordinate to its distance from the start.
+
+        Visited tiles are checked and marked using the functions returned from
+        _bfs_visited(), which subclasses can override. An IndexError is raised
+        if the start coordinate is outside of the grid.
+        '''
+        passable: Callable[[Any], bool] = self.passable
+        neighbors: Callable[[XY], Iterator[tuple[XY, Any]]] = self.neighbors
+        seen: Callable[[XY], bool]
+        mark: Callable[[XY], None]
+        seen, mark = self._bfs_visited(start, max_steps)
+        distances: dict[XY, int] = {start: 0}
+
+        dq: deque[XY] = deque([start])
+        while dq:
+            coord: XY = dq.popleft()
+            steps: int = distances[coord]
+            if coord == goal:
+                return steps
+            if steps == max_steps:
+                continue
+            steps += 1
+
+            neighbor: XY
+            value: Any
+            for neighbor, value in neighbors(coord):
+                if not seen(neighbor) and passable(value):
+                    mark(neighbor)
+                    distances[neighbor] = steps
+                    dq.append(neighbor)
+
+        return distances if goal is None else None
+
+    def _bfs_visited(
+        self,
+        start: XY,
+        max_steps: int | None,  # pylint: disable=unused-argument
+    ) -> tuple[Callable[[XY], bool], Callable[[XY], None]]:
+        '''
+        Check the arguments to bfs(), and return a pair of functions: one which
+        returns True if a coordinate has been visited, and one which marks a
+        coordinate as visited. The start coordinate is already marked.
+
+        Visited tiles are tracked in a bytearray with one byte per tile,
+        indexed by row * cols + col, rather than in a set of coordinates.
+        '''
+        if start not in self:
+            raise IndexError(f'Coordinate {start!r} is outside of grid')
+
+        cols: int = self.cols
+        visited: bytearray = bytearray(self.rows * cols)
+        visited[start[0] * cols + start[1]] = 1
+
+        def seen(coord: XY) -> bool:
+            return visited[coord[0] * cols + coord[1]] == 1
+
+        def mark(coord: XY) -> None:
+            visited[coord[0] * cols + coord[1]] = 1
+
+        return seen, mark
 
     def tile_iter(self) -> Iterator[tuple[XY, str]]:
         '''
@@ -650,33 +1061,209 @@ class Grid(TupleMixin, XYMixin):
             for col in range(self.cols):
                 yield (row, col), self.data[row][col]
 
+    def z_order_iter(self) -> Iterator[XY]:
+        '''
+        Generator which yields each row/column pair in the grid in Z-order
+        (a.k.a. Morton order), rather than row by row. This traverses the grid
+        in progressively larger square blocks, so coordinates which are close
+        to each other in the grid are visited close together in time. This
+        keeps recently-visited rows warm in the cache for work which probes a
+        neighborhood around each coordinate.
+
+        The traversal starts with a square whose sides are the next power of
+        two, and splits each block into quadrants (top-left, bottom-left,
+        top-right, bottom-right), using a stack rather than recursion. Any
+        quadrant which starts outside of the grid is skipped entirely, so the
+        cost scales with the size of the grid rather than the square, even for
+        a grid which is much longer than it is wide.
+        '''
+        rows: int = self.rows
+        cols: int = self.cols
+        side: int = 1 << (max(rows, cols) - 1).bit_length()
+        # An empty grid has no blocks to traverse
+        stack: list[tuple[int, int, int]] = [(0, 0, side)] if rows and cols else []
+        while stack:
+            row, col, size = stack.pop()
+            if size > 2:
+                half: int = size >> 1
+                # Push the quadrants in reverse order, so that they are popped
+                # in Z-order
+                for quad_row, quad_col in (
+                    (row + half, col + half),
+                    (row, col + half),
+                    (row + half, col),
+                    (row, col),
+                ):
+                    if quad_row < rows and quad_col < cols:
+                        stack.append((quad_row, quad_col, half))
+                continue
+
+            # A 2x2 block (or a single cell, for a 1x1 grid) is yielded
+            # directly, rather than being split up any further
+            yield row, col
+            if size == 2:
+                if row + 1 < rows:
+                    yield row + 1, col
+                if col + 1 < cols:
+                    yield row, col + 1
+                    if row + 1 < rows:
+                        yield row + 1, col + 1
+
     def column_iter(self) -> Iterator[str]:
         '''
         Generator which yields the contents of the grid one column at a time
         '''
-        for col in range(self.cols):
-            yield ''.join(
-                str(self.data[row][col])
-                for row in range(self.rows)
-            )
+        # Transpose the grid with zip(), so the columns are assembled in C
+        # rather than by indexing each row. Only convert the contents to
+        # strings if they aren't already.
+        columns: Iterator[tuple[Any, ...]] = zip(*self.data)
+        if self.data and self.data[0] and isinstance(self.data[0][0], str):
+            yield from map(''.join, columns)
+        else:
+            for column in columns:
+                yield ''.join(map(str, column))
 
     def find(self, value: Any) -> XY | None:
         '''
         Return the first row/column pair that matches the specified value, or
         None if there is no match.
         '''
+        # When searching for a single character, join each row into a string
+        # and use str.find(), which scans the raw character buffer rather than
+        # comparing one object at a time. The offset into the joined string is
+        # only the column if every cell before it is a single character. A row
+        # with the same number of characters as cells can still have an empty
+        # cell offsetting a multi-character one, so the cell at the offset is
+        # checked before trusting it. This falls back to list.index() (which
+        # still does its comparisons in C) for any other kind of row, including
+        # rows in which some cells are not strings (which join() rejects).
+        single_char: bool = isinstance(value, str) and len(value) == 1
         for row_index, row in enumerate(self.data):
-            for col_index, col in enumerate(row):
-                if col == value:
-                    return row_index, col_index
+            if single_char and row and isinstance(row[0], str):
+                try:
+                    line: str = ''.join(row)
+                except TypeError:
+                    line = ''
+                if len(line) == len(row):
+                    col_index: int = line.find(value)
+                    if col_index == -1:
+                        continue
+                    if row[col_index] == value:
+                        return row_index, col_index
+            try:
+                return row_index, row.index(value)
+            except (TypeError, ValueError):
+                # TypeError is raised when searching the bytearray rows of a
+                # digit grid for a non-integer value.
+                continue
+
+    def tobytes(self, encoding: str = 'ascii') -> bytes:
+        '''
+        Return the contents of the grid as a single bytes object, with one byte
+        per cell in row-major order (i.e. the cell at (row, col) is at index
+        row * self.cols + col). Grids of characters are encoded as ASCII, while
+        grids of small ints (such as digit grids) store each int as a byte.
+
+        Another encoding can be used for grids of characters, at the cost of
+        no longer having one byte per cell if the grid contains any non-ASCII
+        characters.
+
+        Any row which is shorter than the grid is padded out to the full width,
+        with spaces for a grid of characters, or null bytes otherwise, so that
+        the offsets of the later rows are not thrown off.
+
+        This is a snapshot, and will not reflect later changes to the grid.
+        However, it takes a fraction of the memory of the list of lists, so it
+        is useful for hot loops which only need to read from the grid.
+        '''
+        cols: int = self.cols
+        if self.data and self.data[0] and isinstance(self.data[0][0], str):
+            return ''.join(
+                ''.join(row).ljust(cols) for row in self.data
+            ).encode(encoding)
+        return b''.join(bytes(row).ljust(cols, b'\0') for row in self.data)
+
+    def as_memoryview(self) -> memoryview:
+        '''
+        Return a read-only, two-dimensional memoryview of the bytes from
+        tobytes(), with a shape of (rows, cols). The cell at (row, col) can be
+        read with view[row, col], and is a byte value, so a grid of characters
+        should be compared against ord('#') and the like rather than '#'.
+
+        The view supports the buffer protocol, so it can be passed as-is to
+        anything which accepts a contiguous buffer of unsigned bytes (e.g.
+        numpy.asarray() or a compiled kernel) without copying it again.
+
+        A memoryview cannot be cast to a shape containing a zero, so for an
+        empty grid, a one-dimensional view of zero bytes is returned instead.
+        '''
+        if not self.rows * self.cols:
+            return memoryview(b'')
+        return memoryview(self.tobytes()).cast('B', (self.rows, self.cols))
+
+    def padded(self) -> bytes:
+        '''
+        Return the bytes from tobytes(), surrounded by a border of null bytes
+        one cell wide, so that each row is self.cols + 2 bytes long. Index it
+        using flat_index().
+
+        Every neighbor of a cell within the grid is a valid index into the
+        padded bytes, and the border cells all contain 0. This means a search
+        can expand neighbors with neighbors4() and check the value at each one,
+        without needing to check whether it is within the bounds of the grid.
+        Keep in mind that for digit grids, 0 is also a valid value for a cell
+        within the grid.
+
+        Like tobytes(), this is a snapshot, and will not reflect later changes
+        to the grid.
+        '''
+        buf: bytes = self.tobytes()
+        cols: int = self.cols
+        border: bytes = bytes(cols + 2)
+        return b''.join((
+            border,
+            *(
+                b'\0' + buf[offset:offset + cols] + b'\0'
+                for offset in range(0, len(buf), cols)
+            ),
+            border,
+        ))
+
+    def flat_index(self, row: int, col: int) -> int:
+        '''
+        Return the index of the specified row/column within padded()
+        '''
+        return (row + 1) * (self.cols + 2) + col + 1
+
+    def unflat_index(self, index: int) -> XY:
+        '''
+        Return the row/column for an index within padded(). This is the
+        inverse of flat_index().
+        '''
+        row, col = divmod(index, self.cols + 2)
+        return row - 1, col - 1
+
+    def neighbors4(self, index: int) -> tuple[int, int, int, int]:
+        '''
+        Return the indexes within padded() of the neighbors of the cell at the
+        specified index, in the same order as the directions namedtuple (north,
+        east, south, west).
+
+        Unlike neighbors(), this works on plain ints, so no coordinate tuples
+        are created. There is also no bounds-checking, since the neighbors of
+        a cell on the edge of the grid fall within the padded border.
+        '''
+        width: int = self.cols + 2
+        return index - width, index + 1, index + width, index - 1
 
     def print(self) -> None:
         '''
         Print the grid to stdout
         '''
-        for row in self.data:
-            sys.stdout.write(f'{"".join(str(x) for x in row)}\n')
-        sys.stdout.write('\n')
+        # Assemble the whole grid first, so that it is written in one call
+        sys.stdout.write(
+            '\n'.join(''.join(map(str, row)) for row in self.data) + '\n\n'
+        )
         sys.stdout.flush()
 
     def counter(self, row_start: int = 0) -> Counter:
@@ -684,17 +1271,14 @@ class Grid(TupleMixin, XYMixin):
         Returns a Counter object that summarizes the contents of the Grid
         """
         return Counter(
-            tile for (row, _), tile in self.tile_iter()
-            if row >= row_start
+            itertools.chain.from_iterable(self.data[max(row_start, 0):])
         )
 
     def sha256(self) -> str:
         """
         Produces a sha256 hash of the contents of the grid
         """
-        return hashlib.sha256(
-            ''.join(t[1] for t in self.tile_iter()).encode()
-        ).hexdigest()
+        return hashlib.sha256(self.tobytes('utf-8')).hexdigest()
 
 
 class InfiniteGrid(Grid):
@@ -715,10 +1299,173 @@ class InfiniteGrid(Grid):
         Generator which yields a tuple of each neigbboring coordinate and the
         value stored at that coordinate.
         '''
+        data: list[list[Any]] = self.data
+        rows: int = self.rows
+        cols: int = self.cols
         row, col = coord
         for (row_delta, col_delta) in self.directions:
             new_row, new_col = row + row_delta, col + col_delta
-            yield (new_row, new_col), self[(new_row, new_col)]
+            yield (new_row, new_col), data[new_row % rows][new_col % cols]
+
+    def neighbors_bulk(self, coords: Iterable[XY]) -> list[tuple[XY, Any]]:
+        '''
+        Return the neighbors of many coordinates at once. Like neighbors(),
+        coordinates wrap around to the other side of the grid rather than
+        being bounds-checked.
+        '''
+        data: list[list[Any]] = self.data
+        rows: int = self.rows
+        cols: int = self.cols
+        deltas: Directions = self.directions
+        return [
+            (
+                (new_row := row + row_delta, new_col := col + col_delta),
+                data[new_row % rows][new_col % cols],
+            )
+            for row, col in coords
+            for row_delta, col_delta in deltas
+        ]
+
+    def _bfs_visited(
+        self,
+        start: XY,
+        max_steps: int | None,
+    ) -> tuple[Callable[[XY], bool], Callable[[XY], None]]:
+        '''
+        Same as Grid._bfs_visited(), but since an infinite grid has no bounds,
+        visited tiles are tracked in a set of coordinates rather than in a
+        bytearray, and any start coordinate is valid. A search could go on
+        forever, so max_steps is required.
+        '''
+        if max_steps is None:
+            raise ValueError('max_steps is required to search an infinite grid')
+
+        visited: set[XY] = {start}
+        return visited.__contains__, visited.add
+
+
+class SharedByteGrid(Grid):
+    '''
+    A read-only Grid backed by a shared memory map of a file. Rather than being
+    read into memory, the file is mapped read-only, and each row is a
+    memoryview into the mapping. Cells are therefore byte values (e.g.
+    ord('#') rather than '#'), and the grid cannot be modified. The methods
+    which take or produce characters (find(), passable(), print(), and
+    column_iter()) convert to and from bytes.
+
+    The mapping is shared, so worker processes started with the "fork" start
+    method read the same pages of memory as the parent. To make use of this,
+    the workers should get the grid from the parent's memory (e.g. a
+    module-level variable or a closure), as memoryviews cannot be pickled to
+    be passed as an argument.
+
+    Every line in the file must be the same length, otherwise a ValueError is
+    raised. Both LF and CRLF line endings are supported.
+    '''
+    def __init__(
+        self,
+        path: Path | str,
+        neighbor_order: Directions = directions,
+    ) -> None:
+        '''
+        Map the file and split the mapping into rows
+        '''
+        rows: list[memoryview] = []
+        with open(path, 'rb') as fh:
+            # An empty file cannot be mapped
+            if os.fstat(fh.fileno()).st_size:
+                buf: mmap.mmap = mmap.mmap(
+                    fh.fileno(), 0, access=mmap.ACCESS_READ
+                )
+                # Ignore any trailing line endings, so that they do not
+                # produce extra rows
+                end: int = len(buf)
+                while end and buf[end - 1] in b'\r\n':
+                    end -= 1
+                newline: int = buf.find(b'\n', 0, end)
+                if newline == -1:
+                    newline = end
+                # Each row starts one byte past the previous row's newline,
+                # but a carriage return before the newline is not part of the
+                # row's contents.
+                stride: int = newline + 1
+                cols: int = newline - (buf[newline - 1:newline] == b'\r')
+                line_ending: bytes = buf[cols:stride]
+                view: memoryview = memoryview(buf)
+                start: int
+                for start in range(0, end, stride):
+                    # Each row must be followed by the same line ending as the
+                    # first row, except for the last row, which must end at
+                    # the end of the data. Otherwise, the lines are not all
+                    # the same length, and the rows would be misaligned.
+                    if (
+                        buf[start + cols:start + stride] != line_ending
+                        if start + stride < end
+                        else start + cols != end
+                    ):
+                        raise ValueError(
+                            f'Line {len(rows) + 1} of {path} is not '
+                            f'{cols} characters long'
+                        )
+                    rows.append(view[start:start + cols])
+
+        super().__init__(rows, neighbor_order=neighbor_order)
+
+    @staticmethod
+    def _copy_data(data: list[Any]) -> list[Any]:
+        '''
+        The rows cannot be deep-copied, but they also cannot be changed, so the
+        rows themselves are reused.
+        '''
+        return list(data)
+
+    def passable(self, value: Any) -> bool:
+        '''
+        Return True if the byte value is not a wall (#)
+        '''
+        return value != 0x23
+
+    def find(self, value: Any) -> XY | None:
+        '''
+        Return the first row/column pair that matches the specified value
+        (either a byte value, or a single character), or None if there is no
+        match.
+        '''
+        if isinstance(value, str):
+            if len(value) != 1:
+                return None
+            value = ord(value)
+
+        row_index: int
+        row: memoryview
+        for row_index, row in enumerate(self.data):
+            try:
+                col_index: int = row.tobytes().find(value)
+            except (TypeError, ValueError):
+                # The value is not a byte value
+                return None
+            if col_index != -1:
+                return row_index, col_index
+        return None
+
+    def column_iter(self) -> Iterator[str]:
+        '''
+        Generator which yields the contents of the grid one column at a time
+        '''
+        column: tuple[int, ...]
+        for column in zip(*self.data):
+            yield bytes(column).decode()
+
+    def print(self) -> None:
+        '''
+        Print the grid to stdout
+        '''
+        sys.stdout.write(b'\n'.join(self.data).decode() + '\n\n')
+        sys.stdout.flush()
+
+
+# Extracts the year and day from the name of an AOC subclass
+_CLASS_NAME_RE: re.Pattern = re.compile(r'AOC(\d{4})Day(\d{1,2})')
 
 
 class AOC:
@@ -732,20 +1479,54 @@ class AOC:
     example_data_part1: str = ''
     example_data_part2: str = ''
 
+    # Labels and functions for each part of the solution. Set automatically
+    # when a subclass is defined.
+    _parts: tuple[tuple[str, Callable[[AOC], Any]], ...] = ()
+    # Part number, function, and expected example result for each part which
+    # has a validate_partN attribute. Set automatically when a subclass is
+    # defined.
+    _validations: tuple[tuple[int, Callable[[AOC], Any], Any], ...] = ()
+    # Path to the puzzle input. Set automatically when a subclass is defined.
+    _input_path: Path | None = None
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        '''
+        Gather the solution methods when the subclass is defined, so that run()
+        does not need to look them up by name each time. The year and day are
+        also parsed from the class name, and the path to the puzzle input
+        worked out, once here rather than for every instance.
+        '''
+        super().__init_subclass__(**kwargs)
+        match: re.Match | None = _CLASS_NAME_RE.match(cls.__name__)
+        if match:
+            cls.year, cls.day = (int(n) for n in match.groups())
+        cls._input_path = Path(__file__).parent.parent.joinpath(
+            'inputs',
+            str(cls.year),
+            f'day{cls.day:02d}.txt',
+        )
+
+        cls._parts = tuple(
+            (label, func)
+            for label, name in (
+                ('Answer 1', 'part1'),
+                ('Answer 1 (alternate solution)', 'part1_alt'),
+                ('Answer 2', 'part2'),
+                ('Answer 2 (alternate solution)', 'part2_alt'),
+            )
+            if callable(func := getattr(cls, name, None))
+        )
+        cls._validations = tuple(
+            (part, getattr(cls, f'part{part}'), getattr(cls, f'validate_part{part}'))
+            for part in (1, 2)
+            if hasattr(cls, f'validate_part{part}') and hasattr(cls, f'part{part}')
+        )
+
     def __init__(self, example: bool = False) -> None:
         '''
-        Create Path object for the input file
+        Set whether or not to use the example data
         '''
         self.example: bool = example
-        try:
-            self.year, self.day = (
-                int(n) for n in re.match(
-                    r'AOC(\d{4})Day(\d{1,2})',
-                    self.__class__.__name__,
-                ).groups()
-            )
-        except AttributeError:
-            pass
 
         if hasattr(self, 'post_init'):
             self.post_init()
@@ -758,14 +1539,64 @@ class AOC:
         inputs, it prevents us from needing to rstrip() in the puzzle code.
         '''
         if not self.example:
-            return Path(__file__).parent.parent.joinpath(
-                'inputs',
-                str(self.year),
-                f'day{str(self.day).zfill(2)}.txt',
-            ).read_text().rstrip('\n')
+            return self._input_path.read_text().rstrip('\n')
 
         return self.example_data.strip('\n')
 
+    @functools.cached_property
+    def lines(self) -> tuple[str, ...]:
+        '''
+        The puzzle input, split into lines. This is cached, so that it only
+        needs to be split once no matter how many times it is used.
+        '''
+        return tuple(self.input.splitlines())
+
+    @functools.cached_property
+    def blocks(self) -> tuple[str, ...]:
+        '''
+        The puzzle input, split on blank lines. Also cached.
+        '''
+        return tuple(self.input.split('\n\n'))
+
+    @functools.cached_property
+    def _grids(self) -> dict[tuple[type[Grid], Callable | None, str], Grid]:
+        '''
+        Storage for the Grids created by load_grid()
+        '''
+        return {}
+
+    def load_grid(
+        self,
+        grid_type: type[Grid] = Grid,
+        row_cb: Callable[[str], Any] | None = None,
+        data: str | None = None,
+    ) -> Grid:
+        '''
+        Return a Grid (or Grid subclass) built from the puzzle input, or from
+        the data passed (e.g. self.input_part1 or self.input_part2, for days
+        which have different example data for each part). The Grid is cached
+        by type, callback, and data, so that part1 and part2 can share it
+        rather than each parsing the input again.
+
+        NOTE: Since the Grid is shared, a solution which modifies the Grid
+        should run its reset() method before starting, to undo any changes
+        made by the other part.
+
+        NOTE: The callback is matched by identity, so a lambda written inline
+        in the call is a new object each time, and will never hit the cache.
+        Use a named function (e.g. int), or assign the lambda once and reuse
+        it.
+        '''
+        if data is None:
+            data = self.input
+        key: tuple[type[Grid], Callable | None, str] = (grid_type, row_cb, data)
+        if key not in self._grids:
+            self._grids[key] = (
+                grid_type(data) if row_cb is None
+                else grid_type(data, row_cb)
+            )
+        return self._grids[key]
+
     @property
     def input_part1(self) -> str:
         '''
@@ -796,43 +1627,42 @@ class AOC:
         '''
         Time the function
         '''
-        start: float = time.time()
+        start: int = time.perf_counter_ns()
         ret: Callable = func()
-        total: float = time.time() - start
-        print(f'{label}: {ret} ({total} seconds)')  # pylint: disable=no-member
+        total: float = (time.perf_counter_ns() - start) / 1e9
+        print(f'{label}: {ret} ({total:.6f} seconds)')  # pylint: disable=no-member
 
     def run(self):
         '''
         Run both parts and print the results
         '''
         # Optionally validate input
-        if '-v' in sys.argv:
-            if any(hasattr(self, f'validate_part{n}') for n in (1, 2)):
-                example: AOC = self.__class__(example=True)
-                part: int
-                for part in (1, 2):
-                    try:
-                        expected: Any = getattr(self, f'validate_part{part}')
-                    except AttributeError:
-                        continue
-
-                    result: Any = getattr(example, f'part{part}')()
-                    if result != expected:
-                        sys.stderr.write(
-                            f'Validation failed for Part {part}! '
-                            f'Expected {expected}, got {result}\n'
-                        )
-                        sys.exit(1)
+        if '-v' in sys.argv and self._validations:
+            example: AOC = self.__class__(example=True)
+            part: int
+            validate: Callable[[AOC], Any]
+            expected: Any
+            for part, validate, expected in self._validations:
+                result: Any = validate(example)
+                if result != expected:
+                    sys.stderr.write(
+                        f'Validation failed for Part {part}! '
+                        f'Expected {expected}, got {result}\n'
+                    )
+                    sys.exit(1)
 
         header: str = f'Result for Day {self.day}'
 
         print(header)
         print('-' * len(header))
-        for part in (1, 2):
-            if hasattr(self, f'part{part}'):
-                self.timed_exec(f'Answer {part}', getattr(self, f'part{part}'))
-            if hasattr(self, f'part{part}_alt'):
-                self.timed_exec(
-                    f'Answer {part} (alternate solution)',
-                    getattr(self, f'part{part}_alt'),
-                )
+
+        # Subclasses can define a warmup() method to do one-time setup (such
+        # as triggering the compilation of JIT-compiled helpers) which should
+        # not count towards the time reported for either part.
+        if hasattr(self, 'warmup'):
+            self.warmup()
+
+        label: str
+        func: Callable[[AOC], Any]
+        for label, func in self._parts:
+            self.timed_exec(label, functools.partial(func, self))